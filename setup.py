@@ -39,10 +39,12 @@ setup(
             "langchain_community>=0.3.2",
         ],
         "dev": [
-            "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest>=8.2.0",
+            "pytest-asyncio>=0.26.0",
             "pytest-cov>=4.0.0",
             "pytest-mock>=3.10.0",
+            "pytest-testmon>=2.1.0",
+            "pytest-xdist>=3.5.0",
             "flake8>=6.0.0",
             "black>=23.0.0",
             "isort>=5.12.0",
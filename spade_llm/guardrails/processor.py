@@ -19,6 +19,9 @@ async def apply_input_guardrails(
     send_reply: Optional[Callable[[Message], None]] = None,
 ) -> Optional[str]:
     """Apply input guardrails and return processed content or None if blocked."""
+    if not guardrails:
+        return content
+
     context = {
         "message": message,
         "sender": str(message.sender),
@@ -64,6 +67,9 @@ async def apply_output_guardrails(
     on_trigger: Optional[Callable[[GuardrailResult], None]] = None,
 ) -> str:
     """Apply output guardrails and return processed content."""
+    if not guardrails:
+        return content
+
     context = {
         "original_message": original_message,
         "conversation_id": (original_message.thread
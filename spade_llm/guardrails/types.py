@@ -1,5 +1,6 @@
 """Specific guardrail types for input and output processing."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from .base import Guardrail, GuardrailAction, GuardrailResult
@@ -57,6 +58,7 @@ class CompositeGuardrail(Guardrail):
         stop_on_block: bool = True,
         enabled: bool = True,
         blocked_message: Optional[str] = None,
+        parallel: bool = False,
     ):
         """
         Initialize a composite guardrail.
@@ -67,10 +69,15 @@ class CompositeGuardrail(Guardrail):
             stop_on_block: Whether to stop processing on first block
             enabled: Whether the guardrail is active
             blocked_message: Custom message to return when blocked
+            parallel: Run all children concurrently on the original content.
+                If more than one child modifies it, every modifier after the
+                first is run again on the already modified content, so best
+                suited to independent checks (e.g. several LLM-based ones).
         """
         super().__init__(name, enabled, blocked_message)
         self.guardrails = guardrails
         self.stop_on_block = stop_on_block
+        self.parallel = parallel
 
     async def check(self, content: str, context: Dict[str, Any]) -> GuardrailResult:
         """
@@ -83,31 +90,46 @@ class CompositeGuardrail(Guardrail):
         Returns:
             GuardrailResult from the combined guardrail checks
         """
-        current_content = content
-        accumulated_reasons = []
+        active = [g for g in self.guardrails if g.enabled]
+        if not active:
+            return GuardrailResult(action=GuardrailAction.PASS, content=content)
 
-        for guardrail in self.guardrails:
-            if not guardrail.enabled:
+        current_content = content
+        modified = False
+        # Only allocated once a child reports something other than PASS
+        accumulated_reasons = None
+
+        # In parallel mode every child sees the original content and the
+        # results are folded afterwards in declaration order
+        results = None
+        if self.parallel:
+            results = await asyncio.gather(*(g(content, context) for g in active))
+
+        for index, guardrail in enumerate(active):
+            if results is None:
+                result = await guardrail(current_content, context)
+            else:
+                result = results[index]
+                if result.action == GuardrailAction.MODIFY and modified:
+                    # This change was made to the original content; redo it on
+                    # the modified content so the earlier change is not lost
+                    result = await guardrail(current_content, context)
+
+            if result.action == GuardrailAction.PASS:
                 continue
 
-            result = await guardrail(current_content, context)
-
-            if result.action == GuardrailAction.BLOCK:
-                if self.stop_on_block:
-                    # Use the composite's blocked message if set, otherwise use the individual guardrail's
-                    result.custom_message = (
-                        self.blocked_message or result.custom_message
-                    )
-                    return result
-                else:
-                    accumulated_reasons.append(f"{guardrail.name}: {result.reason}")
+            if result.action == GuardrailAction.BLOCK and self.stop_on_block:
+                # Use the composite's blocked message if set, otherwise use the individual guardrail's
+                result.custom_message = self.blocked_message or result.custom_message
+                return result
 
-            elif result.action == GuardrailAction.MODIFY:
+            if result.action == GuardrailAction.MODIFY:
                 current_content = result.content
-                accumulated_reasons.append(f"{guardrail.name}: {result.reason}")
+                modified = True
 
-            elif result.action == GuardrailAction.WARNING:
-                accumulated_reasons.append(f"{guardrail.name}: {result.reason}")
+            if accumulated_reasons is None:
+                accumulated_reasons = []
+            accumulated_reasons.append(f"{guardrail.name}: {result.reason}")
 
         # If content was modified, return MODIFY action
         if current_content != content:
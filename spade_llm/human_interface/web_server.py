@@ -1,40 +1,266 @@
 """Simple web server for the Human Expert interface."""
 
+import gzip
 import logging
 import os
-from functools import partial
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import queue
+import socket
+import stat
+import threading
+from functools import lru_cache, partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger("spade_llm.human_interface.web_server")
 
+# Smaller files are served as-is; the gzip framing would outweigh the savings
+_GZIP_MIN_SIZE = 1024
+
+
+class _CachedFile(NamedTuple):
+    mtime_ns: int
+    size: int
+    content: bytes
+    gzipped: Optional[bytes]
+
+
+class StaticFileCache:
+    """Size-capped in-memory copy of static files, filled as they are requested.
+
+    Entries are checked against the file's mtime and size on every lookup, so
+    edited files are reloaded. Lookups return None for anything that cannot be
+    cached (missing, unreadable, not a regular file, or over the size caps) so
+    the caller can fall back to serving from disk.
+    """
+
+    def __init__(self, max_file_size=1 << 20, max_total_size=8 << 20):
+        self.max_file_size = max_file_size
+        self.max_total_size = max_total_size
+        self._entries = {}
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the cached entry for path, reading it on first use or after a change."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._discard(path)
+            return None
+        if not stat.S_ISREG(st.st_mode) or st.st_size > self.max_file_size:
+            self._discard(path)
+            return None
+
+        entry = self._entries.get(path)
+        if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+            return entry
+
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        if len(content) != st.st_size:
+            # Changed while reading; let the caller serve it from disk
+            return None
+        gzipped = gzip.compress(content, compresslevel=9) if len(content) >= _GZIP_MIN_SIZE else None
+        entry = _CachedFile(st.st_mtime_ns, st.st_size, content, gzipped)
+
+        with self._lock:
+            self._discard_locked(path)
+            if self._total_size + entry.size <= self.max_total_size:
+                self._entries[path] = entry
+                self._total_size += entry.size
+        return entry
+
+    def _discard(self, path):
+        """Drop the entry for path, if any, and release its share of the total size."""
+        if path in self._entries:
+            with self._lock:
+                self._discard_locked(path)
+
+    def _discard_locked(self, path):
+        old = self._entries.pop(path, None)
+        if old is not None:
+            self._total_size -= old.size
+
 
 class CORSRequestHandler(SimpleHTTPRequestHandler):
     """HTTP request handler with CORS headers."""
 
+    # Keep connections open so the page and its assets share one socket,
+    # but drop idle ones so they do not hold a pool worker forever
+    protocol_version = "HTTP/1.1"
+    timeout = 15
+
+    _PREFLIGHT_HEADERS = (
+        ("Access-Control-Allow-Origin", "*"),
+        ("Access-Control-Allow-Methods", "GET, POST, OPTIONS"),
+        ("Access-Control-Allow-Headers", "Content-Type"),
+        # Let browsers cache the preflight instead of repeating OPTIONS
+        ("Access-Control-Max-Age", "86400"),
+    )
+    _RESPONSE_HEADERS = _PREFLIGHT_HEADERS + (
+        ("Cache-Control", "no-store, no-cache, must-revalidate"),
+    )
+
     def end_headers(self):
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.send_header("Cache-Control", "no-store, no-cache, must-revalidate")
+        for name, value in self._RESPONSE_HEADERS:
+            self.send_header(name, value)
         super().end_headers()
 
-    def do_OPTIONS(self):
+    def do_GET(self):
+        data = self._send_cached_head()
+        if data is None:
+            super().do_GET()
+        else:
+            self.wfile.write(data)
+
+    def do_HEAD(self):
+        if self._send_cached_head() is None:
+            super().do_HEAD()
+
+    def _send_cached_head(self):
+        """Send the headers for a file in the server's static cache and return its body.
+
+        Returns None when the server has no cache, the request is conditional,
+        or the file cannot be cached, so the parent handler serves it instead.
+        """
+        cache = getattr(self.server, "static_cache", None)
+        if cache is None or "If-Modified-Since" in self.headers:
+            return None
+        path = self.translate_path(self.path)
+        if path.endswith("/"):
+            path = os.path.join(path, "index.html")
+        entry = cache.get(path)
+        if entry is None:
+            return None
+
+        data = entry.content
         self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Vary", "Accept-Encoding")
+        if entry.gzipped is not None and self._accepts_gzip():
+            data = entry.gzipped
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Last-Modified", self.date_time_string(entry.mtime_ns / 1e9))
         self.end_headers()
+        return data
+
+    def _accepts_gzip(self):
+        """Return whether Accept-Encoding allows gzip, honouring q-values and '*'."""
+        qualities = {}
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = item.partition(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            quality = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[coding] = quality
+        return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+    def copyfile(self, source, outputfile):
+        # wfile writes straight to the connection, so the kernel can copy the
+        # file into the socket with sendfile() instead of a read/write loop
+        if outputfile is self.wfile and isinstance(self.connection, socket.socket):
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
+    def do_OPTIONS(self):
+        # A 204 has no body, so keep-alive clients do not wait for one, and
+        # skipping Cache-Control here keeps the preflight cacheable
+        self.send_response(204)
+        for name, value in self._PREFLIGHT_HEADERS:
+            self.send_header(name, value)
+        super().end_headers()
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """HTTP server that handles connections on a fixed number of daemon threads."""
+
+    # Only share the port with other processes when explicitly asked; otherwise
+    # a second server on a busy port must fail with "Address already in use"
+    allow_reuse_port = False
+
+    def __init__(self, server_address, RequestHandlerClass, bind_and_activate=True, workers=16,
+                 sock=None, reuse_port=False):
+        if sock is not None and (sock.family not in (socket.AF_INET, socket.AF_INET6)
+                                 or sock.type != socket.SOCK_STREAM):
+            # get_request() sets TCP options and run_server logs a TCP port
+            raise ValueError("sock must be a TCP socket (AF_INET or AF_INET6, SOCK_STREAM)")
+        self.allow_reuse_port = reuse_port
+        # Set up the queue first: a failed bind calls server_close() from __init__
+        self._workers = workers
+        self._requests = queue.SimpleQueue()
+        # Static assets served from memory, read lazily on first request
+        self.static_cache = StaticFileCache()
+        if sock is None:
+            super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+        else:
+            # Adopt a socket that is already bound and listening instead of opening one
+            super().__init__(sock.getsockname(), RequestHandlerClass, bind_and_activate=False)
+            self.socket.close()
+            self.socket = sock
+        for _ in range(workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def _worker(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def server_bind(self):
+        # Let several server processes share the port where the platform allows it
+        if self.allow_reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def get_request(self):
+        request, client_address = super().get_request()
+        # The web client sends many small JSON POSTs; don't hold them back for Nagle
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
+    def process_request(self, request, client_address):
+        self._requests.put((request, client_address))
+
+    def server_close(self):
+        super().server_close()
+        for _ in range(self._workers):
+            self._requests.put(None)
+
+
+@lru_cache(maxsize=1)
+def _default_directory():
+    """Return the bundled web_client folder next to this file."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "web_client")
 
 
-def run_server(port=8080, directory=None):
+def run_server(port=8080, directory=None, workers=16, *, sock=None, reuse_port=False):
     """
     Run a simple HTTP server for the Human Expert web interface.
 
     Args:
         port: Port to run the server on (default: 8080)
         directory: Directory to serve files from (default: web_client folder)
+        workers: Number of threads handling connections (default: 16)
+        sock: Already bound and listening socket to serve on; overrides port
+        reuse_port: Set SO_REUSEPORT so several processes can share the port (default: False)
     """
     if directory is None:
-        # Get the directory where this file is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        directory = os.path.join(current_dir, "web_client")
+        directory = _default_directory()
 
     # Create directory if it doesn't exist
     os.makedirs(directory, exist_ok=True)
@@ -44,10 +270,13 @@ def run_server(port=8080, directory=None):
 
     # Create server
     handler = partial(CORSRequestHandler, directory=directory)
-    httpd = HTTPServer(("localhost", port), handler)
+    if sock is not None:
+        port = sock.getsockname()[1]
+    httpd = PooledHTTPServer(("localhost", port), handler, workers=workers, sock=sock,
+                             reuse_port=reuse_port)
 
-    logger.info(f"Human Expert interface running at http://localhost:{port}")
-    logger.info(f"Serving files from: {directory}")
+    logger.info("Human Expert interface running at http://localhost:%s", port)
+    logger.info("Serving files from: %s", directory)
     logger.info("Press Ctrl+C to stop")
 
     try:
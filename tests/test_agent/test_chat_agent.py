@@ -383,6 +383,7 @@ class TestChatAgentMessageSending:
 class TestChatAgentResponseWaiting:
     """Test ChatAgent response waiting functionality."""
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_wait_for_response_success(self):
         """Test wait_for_response when response is received."""
@@ -518,6 +519,7 @@ class TestRunInteractiveChatFunction:
                 # Should not send any messages
                 mock_agent.send_message.assert_not_called()
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_run_interactive_chat_normal_flow(self):
         """Test run_interactive_chat normal message flow."""
@@ -537,6 +539,7 @@ class TestRunInteractiveChatFunction:
                 # Should wait for response
                 mock_agent.wait_for_response.assert_called_once_with(10.0)
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_run_interactive_chat_timeout(self):
         """Test run_interactive_chat with response timeout."""
@@ -555,6 +558,7 @@ class TestRunInteractiveChatFunction:
                 print_calls = [call[0][0] for call in mock_print.call_args_list]
                 assert any("Timeout waiting for response" in call for call in print_calls)
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_run_interactive_chat_empty_message(self):
         """Test run_interactive_chat with empty message."""
@@ -588,6 +592,7 @@ class TestRunInteractiveChatFunction:
                 print_calls = [call[0][0] for call in mock_print.call_args_list]
                 assert any("Chat interrupted by user" in call for call in print_calls)
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_run_interactive_chat_exception_handling(self):
         """Test run_interactive_chat exception handling."""
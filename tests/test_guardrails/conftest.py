@@ -1,6 +1,7 @@
 """Fixtures for guardrails tests."""
 
 import pytest
+from collections import deque
 from unittest.mock import Mock, AsyncMock
 from typing import Dict, Any
 
@@ -199,10 +200,17 @@ def guardrail_result_modify():
 
 @pytest.fixture
 def trigger_callback_log():
-    """Create a callback function that logs trigger events."""
-    log = []
+    """Create a callback function that logs trigger events.
+    
+    Only the last 64 events are kept; ``callback.dropped`` counts the older
+    ones pushed out once the log is full.
+    """
+    # Bounded so long-running chains keep a constant footprint
+    log = deque(maxlen=64)
     
     def callback(result: GuardrailResult):
+        if len(log) == log.maxlen:
+            callback.dropped += 1
         log.append({
             "action": result.action,
             "reason": result.reason,
@@ -210,4 +218,5 @@ def trigger_callback_log():
         })
     
     callback.log = log
+    callback.dropped = 0
     return callback
@@ -1,5 +1,7 @@
 """Tests for guardrail processor functions."""
 
+import dataclasses
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
@@ -8,119 +10,145 @@ from spade_llm.guardrails.base import GuardrailAction, GuardrailResult
 from spade_llm.guardrails.types import InputGuardrail, OutputGuardrail
 from spade_llm.guardrails.processor import apply_input_guardrails, apply_output_guardrails
 
+# Shared results for cases that need nothing beyond the action
+_PASS = GuardrailResult(action=GuardrailAction.PASS)
+_BLOCK = GuardrailResult(action=GuardrailAction.BLOCK)
+_WARN = GuardrailResult(action=GuardrailAction.WARNING)
+
+
+# (guardrail results, content, expected result, content seen by each guardrail)
+INPUT_CHAIN_CASES = [
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.PASS, content="content"),
+         GuardrailResult(action=GuardrailAction.PASS, content="content")],
+        "Test content", "Test content", ["Test content", "Test content"],
+        id="all_pass",
+    ),
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.BLOCK, reason="blocked"),
+         _PASS],
+        "Test content", None, ["Test content", None],
+        id="first_blocks",
+    ),
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.MODIFY, content="step1"),
+         GuardrailResult(action=GuardrailAction.MODIFY, content="step2"),
+         GuardrailResult(action=GuardrailAction.PASS, content="step2")],
+        "original", "step2", ["original", "step1", "step2"],
+        id="modify_chain",
+    ),
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.WARNING, reason="warning"),
+         GuardrailResult(action=GuardrailAction.PASS, content="final")],
+        "Test content", "Test content", ["Test content", "Test content"],
+        id="warning_continues",
+    ),
+]
 
-class MockInputGuardrail(InputGuardrail):
-    """Mock input guardrail for testing."""
+OUTPUT_CHAIN_CASES = [
+    pytest.param(
+        [_PASS,
+         _PASS],
+        "LLM response", "LLM response", ["LLM response", "LLM response"],
+        id="all_pass",
+    ),
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.BLOCK, custom_message="Response blocked"),
+         _PASS],
+        "LLM response", "I apologize, but I cannot provide that response.", ["LLM response", None],
+        id="first_blocks",
+    ),
+    pytest.param(
+        [GuardrailResult(action=GuardrailAction.MODIFY, content="modified1"),
+         GuardrailResult(action=GuardrailAction.MODIFY, content="modified2")],
+        "original response", "modified2", ["original response", "modified1"],
+        id="modify_chain",
+    ),
+    pytest.param(
+        [_WARN,
+         _PASS],
+        "response", "response", ["response", "response"],
+        id="warning_continues",
+    ),
+]
+
+
+class _FixedInputGuardrail(InputGuardrail):
+    """Input guardrail whose check returns a copy of a preset result."""
     
     def __init__(self, name: str, result: GuardrailResult, **kwargs):
         super().__init__(name, **kwargs)
         self.result = result
-        self.call_log = []
     
     async def check(self, content: str, context: dict) -> GuardrailResult:
-        self.call_log.append({"content": content, "context": context})
-        return self.result
+        # Guardrail.__call__ may set custom_message; keep the shared result intact
+        return dataclasses.replace(self.result)
 
 
-class MockOutputGuardrail(OutputGuardrail):
-    """Mock output guardrail for testing."""
+class _FixedOutputGuardrail(OutputGuardrail):
+    """Output guardrail whose check returns a copy of a preset result."""
     
     def __init__(self, name: str, result: GuardrailResult, **kwargs):
         super().__init__(name, **kwargs)
         self.result = result
-        self.call_log = []
     
     async def check(self, content: str, context: dict) -> GuardrailResult:
-        self.call_log.append({"content": content, "context": context})
-        return self.result
+        return dataclasses.replace(self.result)
+
+
+def make_input_guardrail(name: str, result: GuardrailResult, **kwargs) -> AsyncMock:
+    """Create an input guardrail double that returns ``result`` through Guardrail.__call__.
+    
+    The call goes through a real InputGuardrail, so the ``enabled`` check and the
+    ``blocked_message`` override still apply; the mock only records the awaits.
+    """
+    guardrail = AsyncMock(spec=InputGuardrail, side_effect=_FixedInputGuardrail(name, result, **kwargs).__call__)
+    guardrail.name = name
+    return guardrail
+
+
+def make_output_guardrail(name: str, result: GuardrailResult, **kwargs) -> AsyncMock:
+    """Create an output guardrail double that returns ``result`` through Guardrail.__call__.
+    
+    The call goes through a real OutputGuardrail, so the ``enabled`` check and the
+    ``blocked_message`` override still apply; the mock only records the awaits.
+    """
+    guardrail = AsyncMock(spec=OutputGuardrail, side_effect=_FixedOutputGuardrail(name, result, **kwargs).__call__)
+    guardrail.name = name
+    return guardrail
 
 
 class TestApplyInputGuardrails:
     """Test apply_input_guardrails function."""
     
-    @pytest.mark.asyncio
     async def test_no_guardrails(self, mock_message):
         """Test with empty guardrails list."""
+        content = "Test content"
         result = await apply_input_guardrails(
-            content="Test content",
+            content=content,
             message=mock_message,
             guardrails=[]
         )
         
-        assert result == "Test content"
-    
-    @pytest.mark.asyncio
-    async def test_all_pass(self, mock_message):
-        """Test when all guardrails pass."""
-        guardrail1 = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS, content="content"))
-        guardrail2 = MockInputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS, content="content"))
-        
-        result = await apply_input_guardrails(
-            content="Test content",
-            message=mock_message,
-            guardrails=[guardrail1, guardrail2]
-        )
-        
-        assert result == "Test content"
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 1
-    
-    @pytest.mark.asyncio
-    async def test_first_blocks(self, mock_message):
-        """Test when first guardrail blocks."""
-        guardrail1 = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.BLOCK, reason="blocked"))
-        guardrail2 = MockInputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS))
-        
-        result = await apply_input_guardrails(
-            content="Test content",
-            message=mock_message,
-            guardrails=[guardrail1, guardrail2]
-        )
-        
-        assert result is None  # Blocked
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 0  # Should not be called
-    
-    @pytest.mark.asyncio
-    async def test_modify_chain(self, mock_message):
-        """Test chain of modifications."""
-        guardrail1 = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="step1"))
-        guardrail2 = MockInputGuardrail("g2", GuardrailResult(action=GuardrailAction.MODIFY, content="step2"))
-        guardrail3 = MockInputGuardrail("g3", GuardrailResult(action=GuardrailAction.PASS, content="step2"))
-        
-        result = await apply_input_guardrails(
-            content="original",
-            message=mock_message,
-            guardrails=[guardrail1, guardrail2, guardrail3]
-        )
-        
-        assert result == "step2"
-        
-        # Verify content flows through correctly
-        assert guardrail1.call_log[0]["content"] == "original"
-        assert guardrail2.call_log[0]["content"] == "step1"
-        assert guardrail3.call_log[0]["content"] == "step2"
+        assert result is content
     
-    @pytest.mark.asyncio
-    async def test_warning_continues_processing(self, mock_message):
-        """Test that warnings don't stop processing."""
-        guardrail1 = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.WARNING, reason="warning"))
-        guardrail2 = MockInputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS, content="final"))
-        
+    @pytest.mark.parametrize("results,content,expected,seen", INPUT_CHAIN_CASES)
+    async def test_guardrail_chain(self, mock_message, results, content, expected, seen):
+        """Test how each action affects the rest of the chain."""
+        guardrails = [make_input_guardrail(f"g{i}", r) for i, r in enumerate(results, 1)]
+
         result = await apply_input_guardrails(
-            content="Test content",
+            content=content,
             message=mock_message,
-            guardrails=[guardrail1, guardrail2]
+            guardrails=guardrails
         )
-        
-        assert result == "Test content"  # Should continue
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 1
+
+        assert result == expected
+        assert [g.await_args.args[0] if g.await_count else None for g in guardrails] == seen
     
-    @pytest.mark.asyncio
     async def test_context_creation(self, mock_message):
         """Test that context is properly created."""
-        guardrail = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS))
+        guardrail = make_input_guardrail("g1", _PASS)
         
         await apply_input_guardrails(
             content="Test content",
@@ -128,12 +156,24 @@ class TestApplyInputGuardrails:
             guardrails=[guardrail]
         )
         
-        context = guardrail.call_log[0]["context"]
+        context = guardrail.await_args.args[1]
         assert context["message"] == mock_message
         assert context["sender"] == str(mock_message.sender)
         assert "conversation_id" in context
     
-    @pytest.mark.asyncio
+    async def test_context_shared_across_chain(self, mock_message):
+        """Test that every guardrail in the chain receives the same context."""
+        guardrail1 = make_input_guardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod"))
+        guardrail2 = make_input_guardrail("g2", _PASS)
+        
+        await apply_input_guardrails(
+            content="Test content",
+            message=mock_message,
+            guardrails=[guardrail1, guardrail2]
+        )
+        
+        assert guardrail1.await_args.args[1] is guardrail2.await_args.args[1]
+    
     async def test_conversation_id_from_thread(self):
         """Test conversation ID creation from message thread."""
         msg = Mock(spec=Message)
@@ -141,7 +181,7 @@ class TestApplyInputGuardrails:
         msg.sender = "user@example.com"
         msg.to = "bot@example.com"
         
-        guardrail = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS))
+        guardrail = make_input_guardrail("g1", _PASS)
         
         await apply_input_guardrails(
             content="Test",
@@ -149,10 +189,9 @@ class TestApplyInputGuardrails:
             guardrails=[guardrail]
         )
         
-        context = guardrail.call_log[0]["context"]
+        context = guardrail.await_args.args[1]
         assert context["conversation_id"] == "custom_thread_123"
     
-    @pytest.mark.asyncio
     async def test_conversation_id_fallback(self):
         """Test conversation ID fallback when no thread."""
         msg = Mock(spec=Message)
@@ -160,7 +199,7 @@ class TestApplyInputGuardrails:
         msg.sender = "user@example.com"
         msg.to = "bot@example.com"
         
-        guardrail = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS))
+        guardrail = make_input_guardrail("g1", _PASS)
         
         await apply_input_guardrails(
             content="Test",
@@ -168,14 +207,13 @@ class TestApplyInputGuardrails:
             guardrails=[guardrail]
         )
         
-        context = guardrail.call_log[0]["context"]
+        context = guardrail.await_args.args[1]
         assert context["conversation_id"] == "user@example.com_bot@example.com"
     
-    @pytest.mark.asyncio
     async def test_trigger_callback_called(self, mock_message, trigger_callback_log):
         """Test that trigger callback is called for all actions."""
-        guardrail1 = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod", reason="modified"))
-        guardrail2 = MockInputGuardrail("g2", GuardrailResult(action=GuardrailAction.WARNING, reason="warning"))
+        guardrail1 = make_input_guardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod", reason="modified"))
+        guardrail2 = make_input_guardrail("g2", GuardrailResult(action=GuardrailAction.WARNING, reason="warning"))
         
         await apply_input_guardrails(
             content="Test",
@@ -187,12 +225,29 @@ class TestApplyInputGuardrails:
         assert len(trigger_callback_log.log) == 2
         assert trigger_callback_log.log[0]["action"] == GuardrailAction.MODIFY
         assert trigger_callback_log.log[1]["action"] == GuardrailAction.WARNING
-
     
-    @pytest.mark.asyncio
+    async def test_trigger_callback_log_counts_overflow(self, mock_message, trigger_callback_log):
+        """Test that the trigger log keeps the newest 64 events and counts the rest."""
+        guardrails = [
+            make_input_guardrail(f"g{i}", GuardrailResult(action=GuardrailAction.WARNING, reason=str(i)))
+            for i in range(66)
+        ]
+        
+        await apply_input_guardrails(
+            content="Test",
+            message=mock_message,
+            guardrails=guardrails,
+            on_trigger=trigger_callback_log
+        )
+        
+        assert len(trigger_callback_log.log) == 64
+        assert trigger_callback_log.dropped == 2
+        assert trigger_callback_log.log[0]["reason"] == "2"
+        assert trigger_callback_log.log[-1]["reason"] == "65"
+    
     async def test_send_reply_default_message(self, mock_message):
         """Test default block message when no custom message."""
-        guardrail = MockInputGuardrail("g1", GuardrailResult(action=GuardrailAction.BLOCK))
+        guardrail = make_input_guardrail("g1", _BLOCK)
         
         send_reply_mock = AsyncMock()
         
@@ -210,56 +265,34 @@ class TestApplyInputGuardrails:
 class TestApplyOutputGuardrails:
     """Test apply_output_guardrails function."""
     
-    @pytest.mark.asyncio
     async def test_no_guardrails(self, mock_message):
         """Test with empty guardrails list."""
+        content = "LLM response"
         result = await apply_output_guardrails(
-            content="LLM response",
+            content=content,
             original_message=mock_message,
             guardrails=[]
         )
         
-        assert result == "LLM response"
-    
-    @pytest.mark.asyncio
-    async def test_all_pass(self, mock_message):
-        """Test when all guardrails pass."""
-        guardrail1 = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS))
-        guardrail2 = MockOutputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS))
-        
-        result = await apply_output_guardrails(
-            content="LLM response",
-            original_message=mock_message,
-            guardrails=[guardrail1, guardrail2]
-        )
-        
-        assert result == "LLM response"
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 1
+        assert result is content
     
-    @pytest.mark.asyncio
-    async def test_first_blocks(self, mock_message):
-        """Test when first guardrail blocks."""
-        guardrail1 = MockOutputGuardrail("g1", GuardrailResult(
-            action=GuardrailAction.BLOCK, 
-            custom_message="Response blocked"
-        ))
-        guardrail2 = MockOutputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS))
-        
+    @pytest.mark.parametrize("results,content,expected,seen", OUTPUT_CHAIN_CASES)
+    async def test_guardrail_chain(self, mock_message, results, content, expected, seen):
+        """Test how each action affects the rest of the chain."""
+        guardrails = [make_output_guardrail(f"g{i}", r) for i, r in enumerate(results, 1)]
+
         result = await apply_output_guardrails(
-            content="LLM response",
+            content=content,
             original_message=mock_message,
-            guardrails=[guardrail1, guardrail2]
+            guardrails=guardrails
         )
-        
-        assert result == "I apologize, but I cannot provide that response."
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 0  # Should not be called after block
+
+        assert result == expected
+        assert [g.await_args.args[0] if g.await_count else None for g in guardrails] == seen
     
-    @pytest.mark.asyncio
     async def test_block_default_message(self, mock_message):
         """Test default message when blocking without custom message."""
-        guardrail = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.BLOCK))
+        guardrail = make_output_guardrail("g1", _BLOCK)
         
         result = await apply_output_guardrails(
             content="LLM response",
@@ -269,44 +302,37 @@ class TestApplyOutputGuardrails:
         
         assert "cannot provide that response" in result.lower()
     
-    @pytest.mark.asyncio
-    async def test_modify_chain(self, mock_message):
-        """Test chain of modifications."""
-        guardrail1 = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="modified1"))
-        guardrail2 = MockOutputGuardrail("g2", GuardrailResult(action=GuardrailAction.MODIFY, content="modified2"))
+    async def test_block_custom_blocked_message(self, mock_message):
+        """Test that a guardrail's blocked_message replaces the result's own message."""
+        guardrail = make_output_guardrail(
+            "g1",
+            GuardrailResult(action=GuardrailAction.BLOCK, custom_message="Response blocked"),
+            blocked_message="Filtered by policy"
+        )
         
         result = await apply_output_guardrails(
-            content="original response",
+            content="LLM response",
             original_message=mock_message,
-            guardrails=[guardrail1, guardrail2]
+            guardrails=[guardrail]
         )
         
-        assert result == "modified2"
-        
-        # Verify content flows through
-        assert guardrail1.call_log[0]["content"] == "original response"
-        assert guardrail2.call_log[0]["content"] == "modified1"
+        assert result == "Filtered by policy"
     
-    @pytest.mark.asyncio
-    async def test_warning_continues(self, mock_message):
-        """Test that warnings don't stop processing."""
-        guardrail1 = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.WARNING))
-        guardrail2 = MockOutputGuardrail("g2", GuardrailResult(action=GuardrailAction.PASS))
+    async def test_disabled_guardrail_passes(self, mock_message):
+        """Test that a disabled guardrail lets content through unchanged."""
+        guardrail = make_output_guardrail("g1", _BLOCK, enabled=False)
         
         result = await apply_output_guardrails(
-            content="response",
+            content="LLM response",
             original_message=mock_message,
-            guardrails=[guardrail1, guardrail2]
+            guardrails=[guardrail]
         )
         
-        assert result == "response"
-        assert len(guardrail1.call_log) == 1
-        assert len(guardrail2.call_log) == 1
+        assert result == "LLM response"
     
-    @pytest.mark.asyncio
     async def test_context_creation(self, mock_message):
         """Test that output context is properly created."""
-        guardrail = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.PASS))
+        guardrail = make_output_guardrail("g1", _PASS)
         
         await apply_output_guardrails(
             content="LLM response",
@@ -314,16 +340,28 @@ class TestApplyOutputGuardrails:
             guardrails=[guardrail]
         )
         
-        context = guardrail.call_log[0]["context"]
+        context = guardrail.await_args.args[1]
         assert context["original_message"] == mock_message
         assert context["llm_response"] == "LLM response"
         assert "conversation_id" in context
     
-    @pytest.mark.asyncio
+    async def test_context_shared_across_chain(self, mock_message):
+        """Test that every guardrail in the chain receives the same context."""
+        guardrail1 = make_output_guardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod"))
+        guardrail2 = make_output_guardrail("g2", _PASS)
+        
+        await apply_output_guardrails(
+            content="LLM response",
+            original_message=mock_message,
+            guardrails=[guardrail1, guardrail2]
+        )
+        
+        assert guardrail1.await_args.args[1] is guardrail2.await_args.args[1]
+    
     async def test_trigger_callback_called(self, mock_message, trigger_callback_log):
         """Test that trigger callback is called."""
-        guardrail1 = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod", reason="modified"))
-        guardrail2 = MockOutputGuardrail("g2", GuardrailResult(action=GuardrailAction.WARNING, reason="warning"))
+        guardrail1 = make_output_guardrail("g1", GuardrailResult(action=GuardrailAction.MODIFY, content="mod", reason="modified"))
+        guardrail2 = make_output_guardrail("g2", GuardrailResult(action=GuardrailAction.WARNING, reason="warning"))
         
         await apply_output_guardrails(
             content="response",
@@ -336,10 +374,9 @@ class TestApplyOutputGuardrails:
         assert trigger_callback_log.log[0]["action"] == GuardrailAction.MODIFY
         assert trigger_callback_log.log[1]["action"] == GuardrailAction.WARNING
     
-    @pytest.mark.asyncio
     async def test_trigger_callback_on_block(self, mock_message, trigger_callback_log):
         """Test trigger callback is called on block."""
-        guardrail = MockOutputGuardrail("g1", GuardrailResult(action=GuardrailAction.BLOCK, reason="unsafe"))
+        guardrail = make_output_guardrail("g1", GuardrailResult(action=GuardrailAction.BLOCK, reason="unsafe"))
         
         await apply_output_guardrails(
             content="response",
@@ -356,17 +393,16 @@ class TestApplyOutputGuardrails:
 class TestProcessorIntegration:
     """Integration tests for processor functions."""
     
-    @pytest.mark.asyncio
     async def test_input_output_pipeline(self, mock_message):
         """Test complete input -> LLM -> output pipeline simulation."""
         # Input guardrails
-        input_guardrail = MockInputGuardrail("input", GuardrailResult(
+        input_guardrail = make_input_guardrail("input", GuardrailResult(
             action=GuardrailAction.MODIFY, 
             content="[SAFE] original input"
         ))
         
         # Output guardrails
-        output_guardrail = MockOutputGuardrail("output", GuardrailResult(
+        output_guardrail = make_output_guardrail("output", GuardrailResult(
             action=GuardrailAction.MODIFY, 
             content="Safe LLM response [VERIFIED]"
         ))
@@ -392,10 +428,9 @@ class TestProcessorIntegration:
         
         assert final_output == "Safe LLM response [VERIFIED]"
     
-    @pytest.mark.asyncio
     async def test_input_blocked_stops_pipeline(self, mock_message):
         """Test that input blocking stops the entire pipeline."""
-        input_guardrail = MockInputGuardrail("input", GuardrailResult(action=GuardrailAction.BLOCK))
+        input_guardrail = make_input_guardrail("input", _BLOCK)
         
         processed_input = await apply_input_guardrails(
             content="malicious input",
@@ -405,33 +440,32 @@ class TestProcessorIntegration:
         
         assert processed_input is None  # Pipeline should stop here
     
-    @pytest.mark.asyncio
     async def test_complex_multi_guardrail_scenario(self, mock_message, trigger_callback_log):
         """Test complex scenario with multiple guardrails and actions."""
         # Multiple input guardrails with different behaviors
         input_guardrails = [
-            MockInputGuardrail("sanitizer", GuardrailResult(
+            make_input_guardrail("sanitizer", GuardrailResult(
                 action=GuardrailAction.MODIFY, 
                 content="sanitized input",
                 reason="Removed harmful content"
             )),
-            MockInputGuardrail("warner", GuardrailResult(
+            make_input_guardrail("warner", GuardrailResult(
                 action=GuardrailAction.WARNING,
                 reason="Potentially suspicious content"
             )),
-            MockInputGuardrail("validator", GuardrailResult(
+            make_input_guardrail("validator", GuardrailResult(
                 action=GuardrailAction.PASS
             ))
         ]
         
         # Multiple output guardrails
         output_guardrails = [
-            MockOutputGuardrail("content_filter", GuardrailResult(
+            make_output_guardrail("content_filter", GuardrailResult(
                 action=GuardrailAction.MODIFY,
                 content="filtered response",
                 reason="Filtered sensitive information"
             )),
-            MockOutputGuardrail("quality_check", GuardrailResult(
+            make_output_guardrail("quality_check", GuardrailResult(
                 action=GuardrailAction.PASS
             ))
         ]
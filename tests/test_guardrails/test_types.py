@@ -1,12 +1,21 @@
 """Tests for guardrail types (Input, Output, Composite)."""
 
+import asyncio
+from collections import namedtuple
+
 import pytest
-from unittest.mock import Mock, AsyncMock
 
-from spade_llm.guardrails.base import GuardrailAction, GuardrailResult, Guardrail
+from spade_llm.guardrails.base import GuardrailAction, GuardrailResult
 from spade_llm.guardrails.types import InputGuardrail, OutputGuardrail, CompositeGuardrail
 
 
+# Read-only results shared by tests that only need a plain PASS
+_PASS = GuardrailResult(action=GuardrailAction.PASS)
+
+# One recorded check() invocation
+_Call = namedtuple("_Call", "content context")
+
+
 class ConcreteInputGuardrail(InputGuardrail):
     """Concrete implementation for testing InputGuardrail."""
     
@@ -16,7 +25,7 @@ class ConcreteInputGuardrail(InputGuardrail):
         self.call_log = []
     
     async def check(self, content: str, context: dict) -> GuardrailResult:
-        self.call_log.append({"content": content, "context": context})
+        self.call_log.append(_Call(content, context))
         return self.result
 
 
@@ -29,43 +38,37 @@ class ConcreteOutputGuardrail(OutputGuardrail):
         self.call_log = []
     
     async def check(self, content: str, context: dict) -> GuardrailResult:
-        self.call_log.append({"content": content, "context": context})
+        self.call_log.append(_Call(content, context))
         return self.result
 
 
+@pytest.fixture
+def make_child():
+    """Factory for composite children, reusing the shared PASS result when possible."""
+    def _make(name, action=GuardrailAction.PASS, enabled=True, **result_kwargs):
+        if action == GuardrailAction.PASS and not result_kwargs:
+            result = _PASS
+        else:
+            result = GuardrailResult(action=action, **result_kwargs)
+        return ConcreteInputGuardrail(name, result, enabled=enabled)
+    return _make
+
+
 class TestInputGuardrail:
     """Test InputGuardrail class."""
     
-    def test_initialization_defaults(self):
-        """Test InputGuardrail initialization with defaults."""
-        result = GuardrailResult(action=GuardrailAction.PASS)
-        guardrail = ConcreteInputGuardrail("input_test", result)
-        
-        assert guardrail.name == "input_test"
-        assert guardrail.enabled is True
-        assert guardrail.blocked_message == "Your message was blocked by security filters."
-    
-    def test_initialization_custom_message(self):
-        """Test InputGuardrail with custom blocked message."""
-        result = GuardrailResult(action=GuardrailAction.PASS)
-        guardrail = ConcreteInputGuardrail(
-            "input_test", 
-            result,
-            blocked_message="Custom input block message"
-        )
-        
-        assert guardrail.blocked_message == "Custom input block message"
-    
-    def test_initialization_other_params(self):
-        """Test InputGuardrail with other parameters."""
-        result = GuardrailResult(action=GuardrailAction.PASS)
-        guardrail = ConcreteInputGuardrail(
-            "input_test", 
-            result,
-            enabled=False
-        )
-        
-        assert guardrail.enabled is False
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({}, "name", "input_test"),
+        ({}, "enabled", True),
+        ({}, "blocked_message", "Your message was blocked by security filters."),
+        ({"blocked_message": "Custom input block message"}, "blocked_message", "Custom input block message"),
+        ({"enabled": False}, "enabled", False),
+    ])
+    def test_initialization(self, kwargs, attr, expected):
+        """Test InputGuardrail initialization."""
+        guardrail = ConcreteInputGuardrail("input_test", _PASS, **kwargs)
+        
+        assert getattr(guardrail, attr) == expected
     
     @pytest.mark.asyncio
     async def test_check_method_called(self):
@@ -77,32 +80,24 @@ class TestInputGuardrail:
         
         assert response == result
         assert len(guardrail.call_log) == 1
-        assert guardrail.call_log[0]["content"] == "test input"
-        assert guardrail.call_log[0]["context"] == {"key": "value"}
+        assert guardrail.call_log[0].content == "test input"
+        assert guardrail.call_log[0].context == {"key": "value"}
 
 
 class TestOutputGuardrail:
     """Test OutputGuardrail class."""
     
-    def test_initialization_defaults(self):
-        """Test OutputGuardrail initialization with defaults."""
-        result = GuardrailResult(action=GuardrailAction.PASS)
-        guardrail = ConcreteOutputGuardrail("output_test", result)
-        
-        assert guardrail.name == "output_test"
-        assert guardrail.enabled is True
-        assert guardrail.blocked_message == "I apologize, but I cannot provide that response."
-    
-    def test_initialization_custom_message(self):
-        """Test OutputGuardrail with custom blocked message."""
-        result = GuardrailResult(action=GuardrailAction.PASS)
-        guardrail = ConcreteOutputGuardrail(
-            "output_test", 
-            result,
-            blocked_message="Custom output block message"
-        )
-        
-        assert guardrail.blocked_message == "Custom output block message"
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({}, "name", "output_test"),
+        ({}, "enabled", True),
+        ({}, "blocked_message", "I apologize, but I cannot provide that response."),
+        ({"blocked_message": "Custom output block message"}, "blocked_message", "Custom output block message"),
+    ])
+    def test_initialization(self, kwargs, attr, expected):
+        """Test OutputGuardrail initialization."""
+        guardrail = ConcreteOutputGuardrail("output_test", _PASS, **kwargs)
+        
+        assert getattr(guardrail, attr) == expected
     
     @pytest.mark.asyncio
     async def test_check_method_called(self):
@@ -114,17 +109,17 @@ class TestOutputGuardrail:
         
         assert response == result
         assert len(guardrail.call_log) == 1
-        assert guardrail.call_log[0]["content"] == "test output"
-        assert guardrail.call_log[0]["context"] == {"context": "data"}
+        assert guardrail.call_log[0].content == "test output"
+        assert guardrail.call_log[0].context == {"context": "data"}
 
 
 class TestCompositeGuardrail:
     """Test CompositeGuardrail class."""
     
-    def test_initialization(self):
+    def test_initialization(self, make_child):
         """Test CompositeGuardrail initialization."""
-        child1 = ConcreteInputGuardrail("child1", GuardrailResult(action=GuardrailAction.PASS))
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(action=GuardrailAction.PASS))
+        child1 = make_child("child1")
+        child2 = make_child("child2")
         
         composite = CompositeGuardrail(
             name="composite_test",
@@ -138,9 +133,9 @@ class TestCompositeGuardrail:
         assert composite.stop_on_block is True
         assert composite.blocked_message == "Composite blocked"
     
-    def test_initialization_defaults(self):
+    def test_initialization_defaults(self, make_child):
         """Test CompositeGuardrail with defaults."""
-        child = ConcreteInputGuardrail("child", GuardrailResult(action=GuardrailAction.PASS))
+        child = make_child("child")
         composite = CompositeGuardrail("test", [child])
         
         assert composite.stop_on_block is True
@@ -148,10 +143,10 @@ class TestCompositeGuardrail:
         assert composite.blocked_message is None
     
     @pytest.mark.asyncio
-    async def test_all_pass(self):
+    async def test_all_pass(self, make_child):
         """Test composite when all guardrails pass."""
-        child1 = ConcreteInputGuardrail("child1", GuardrailResult(action=GuardrailAction.PASS, content="content"))
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(action=GuardrailAction.PASS, content="content"))
+        child1 = make_child("child1", content="content")
+        child2 = make_child("child2", content="content")
         
         composite = CompositeGuardrail("test", [child1, child2])
         
@@ -163,10 +158,10 @@ class TestCompositeGuardrail:
         assert len(child2.call_log) == 1
     
     @pytest.mark.asyncio
-    async def test_first_blocks_stop_on_block(self):
+    async def test_first_blocks_stop_on_block(self, make_child):
         """Test composite when first guardrail blocks and stop_on_block=True."""
-        child1 = ConcreteInputGuardrail("child1", GuardrailResult(action=GuardrailAction.BLOCK, reason="blocked"))
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(action=GuardrailAction.PASS))
+        child1 = make_child("child1", GuardrailAction.BLOCK, reason="blocked")
+        child2 = make_child("child2")
         
         composite = CompositeGuardrail("test", [child1, child2], stop_on_block=True)
         
@@ -178,10 +173,10 @@ class TestCompositeGuardrail:
         assert len(child2.call_log) == 0  # Should not be called
     
     @pytest.mark.asyncio
-    async def test_first_blocks_no_stop_on_block(self):
+    async def test_first_blocks_no_stop_on_block(self, make_child):
         """Test composite when first guardrail blocks and stop_on_block=False."""
-        child1 = ConcreteInputGuardrail("child1", GuardrailResult(action=GuardrailAction.BLOCK, reason="block1"))
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(action=GuardrailAction.PASS))
+        child1 = make_child("child1", GuardrailAction.BLOCK, reason="block1")
+        child2 = make_child("child2")
         
         composite = CompositeGuardrail("test", [child1, child2], stop_on_block=False)
         
@@ -211,22 +206,20 @@ class TestCompositeGuardrail:
         
         assert result.action == GuardrailAction.MODIFY
         assert result.content == "modified2"  # Last modification wins
-        assert "child1: first mod; child2: second mod" in result.reason
+        assert result.reason == "child1: first mod; child2: second mod"
         
         # Verify content flows through
-        assert child1.call_log[0]["content"] == "original"
-        assert child2.call_log[0]["content"] == "modified1"
+        assert child1.call_log[0].content == "original"
+        assert child2.call_log[0].content == "modified1"
     
     @pytest.mark.asyncio
-    async def test_warning_accumulation(self):
+    async def test_warning_accumulation(self, make_child):
         """Test composite with warnings."""
         child1 = ConcreteInputGuardrail("child1", GuardrailResult(
             action=GuardrailAction.WARNING,
             reason="warning1"
         ))
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(
-            action=GuardrailAction.PASS
-        ))
+        child2 = make_child("child2")
         
         composite = CompositeGuardrail("test", [child1, child2])
         
@@ -237,11 +230,11 @@ class TestCompositeGuardrail:
         # Warnings should not affect final result but may be logged in reason
     
     @pytest.mark.asyncio
-    async def test_disabled_child_skipped(self):
+    async def test_disabled_child_skipped(self, make_child):
         """Test that disabled child guardrails are skipped."""
-        child1 = ConcreteInputGuardrail("child1", GuardrailResult(action=GuardrailAction.PASS))
+        child1 = make_child("child1")
         child1.enabled = False
-        child2 = ConcreteInputGuardrail("child2", GuardrailResult(action=GuardrailAction.PASS))
+        child2 = make_child("child2")
         
         composite = CompositeGuardrail("test", [child1, child2])
         
@@ -251,6 +244,18 @@ class TestCompositeGuardrail:
         assert len(child1.call_log) == 0  # Should be skipped
         assert len(child2.call_log) == 1  # Should be called
     
+    @pytest.mark.asyncio
+    async def test_child_toggled_between_checks(self, make_child):
+        """Test that enabling a child is honoured on the next check."""
+        child = make_child("child", enabled=False)
+        composite = CompositeGuardrail("test", [child])
+        
+        await composite.check("first", {})
+        child.enabled = True
+        await composite.check("second", {})
+        
+        assert [call.content for call in child.call_log] == ["second"]
+    
     @pytest.mark.asyncio
     async def test_empty_guardrails_list(self):
         """Test composite with empty guardrails list."""
@@ -261,6 +266,21 @@ class TestCompositeGuardrail:
         assert result.action == GuardrailAction.PASS
         assert result.content == "content"
     
+    @pytest.mark.asyncio
+    async def test_all_children_disabled(self, make_child):
+        """Test composite when every child guardrail is disabled."""
+        child1 = make_child("child1", enabled=False)
+        child2 = make_child("child2", enabled=False)
+        
+        composite = CompositeGuardrail("test", [child1, child2])
+        
+        result = await composite.check("content", {})
+        
+        assert result.action == GuardrailAction.PASS
+        assert result.content == "content"
+        assert len(child1.call_log) == 0
+        assert len(child2.call_log) == 0
+    
     @pytest.mark.asyncio
     async def test_composite_blocked_message_override(self):
         """Test that composite blocked_message overrides child message."""
@@ -282,7 +302,7 @@ class TestCompositeGuardrail:
 
     
     @pytest.mark.asyncio
-    async def test_complex_scenario(self):
+    async def test_complex_scenario(self, make_child):
         """Test complex scenario with multiple actions."""
         # First modifies, second warns, third passes
         child1 = ConcreteInputGuardrail("modifier", GuardrailResult(
@@ -294,9 +314,7 @@ class TestCompositeGuardrail:
             action=GuardrailAction.WARNING,
             reason="suspicious content"
         ))
-        child3 = ConcreteInputGuardrail("passer", GuardrailResult(
-            action=GuardrailAction.PASS
-        ))
+        child3 = make_child("passer")
         
         composite = CompositeGuardrail("complex", [child1, child2, child3])
         
@@ -308,6 +326,105 @@ class TestCompositeGuardrail:
         assert "warner: suspicious content" in result.reason
         
         # Verify call chain
-        assert child1.call_log[0]["content"] == "original"
-        assert child2.call_log[0]["content"] == "step1"
-        assert child3.call_log[0]["content"] == "step1"
+        assert child1.call_log[0].content == "original"
+        assert child2.call_log[0].content == "step1"
+        assert child3.call_log[0].content == "step1"
+
+    def test_sequential_check_does_not_suspend(self, make_child):
+        """Test that non-suspending children complete without an event loop round-trip."""
+        child1 = make_child("child1")
+        child2 = make_child("child2")
+        
+        composite = CompositeGuardrail("test", [child1, child2])
+        coro = composite.check("content", {})
+        
+        # Awaiting a coroutine that never suspends runs inline, so the whole
+        # check finishes on the first send()
+        with pytest.raises(StopIteration) as exc_info:
+            coro.send(None)
+        
+        assert exc_info.value.value.action == GuardrailAction.PASS
+        assert len(child2.call_log) == 1
+    
+    @pytest.mark.asyncio
+    async def test_parallel_children_run_concurrently(self):
+        """Test that parallel mode runs children at the same time."""
+        both_started = asyncio.Event()
+        started = []
+
+        class WaitingGuardrail(InputGuardrail):
+            async def check(self, content, context):
+                started.append(self.name)
+                if len(started) == 2:
+                    both_started.set()
+                await both_started.wait()
+                return GuardrailResult(action=GuardrailAction.PASS, content=content)
+
+        composite = CompositeGuardrail(
+            "test",
+            [WaitingGuardrail("child1"), WaitingGuardrail("child2")],
+            parallel=True
+        )
+
+        # Sequential execution would never let the first child finish
+        result = await asyncio.wait_for(composite.check("content", {}), timeout=1)
+
+        assert result.action == GuardrailAction.PASS
+        assert started == ["child1", "child2"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_children_see_original_content(self):
+        """Test that parallel mode folds results in order without chaining."""
+        child1 = ConcreteInputGuardrail("child1", GuardrailResult(
+            action=GuardrailAction.MODIFY,
+            content="modified1",
+            reason="first mod"
+        ))
+        child2 = ConcreteInputGuardrail("child2", GuardrailResult(
+            action=GuardrailAction.WARNING,
+            reason="warning"
+        ))
+        child3 = ConcreteInputGuardrail("child3", GuardrailResult(
+            action=GuardrailAction.BLOCK,
+            reason="blocked"
+        ))
+
+        composite = CompositeGuardrail("test", [child1, child2, child3], parallel=True)
+
+        result = await composite.check("original", {})
+
+        assert result.action == GuardrailAction.BLOCK
+        assert result.reason == "blocked"
+        assert child1.call_log[0].content == "original"
+        assert child2.call_log[0].content == "original"
+        assert child3.call_log[0].content == "original"
+
+    @pytest.mark.asyncio
+    async def test_parallel_modifications_are_all_applied(self):
+        """Test that a second modifying child in parallel mode keeps the first change."""
+        class ReplacingGuardrail(InputGuardrail):
+            def __init__(self, name, old, new):
+                super().__init__(name)
+                self.old, self.new = old, new
+                self.seen = []
+
+            async def check(self, content, context):
+                self.seen.append(content)
+                return GuardrailResult(
+                    action=GuardrailAction.MODIFY,
+                    content=content.replace(self.old, self.new),
+                    reason=f"replaced {self.old}"
+                )
+
+        child1 = ReplacingGuardrail("child1", "email", "[EMAIL]")
+        child2 = ReplacingGuardrail("child2", "phone", "[PHONE]")
+
+        composite = CompositeGuardrail("test", [child1, child2], parallel=True)
+
+        result = await composite.check("email and phone", {})
+
+        assert result.action == GuardrailAction.MODIFY
+        assert result.content == "[EMAIL] and [PHONE]"
+        assert result.reason == "child1: replaced email; child2: replaced phone"
+        assert child1.seen == ["email and phone"]
+        assert child2.seen == ["email and phone", "[EMAIL] and phone"]
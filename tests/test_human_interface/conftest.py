@@ -3,39 +3,72 @@
 import pytest
 import tempfile
 import os
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
+
+from spade_llm.human_interface import web_server as ws
 
 
 @pytest.fixture
 def mock_http_server():
-    """Mock HTTPServer for testing."""
-    with patch('spade_llm.human_interface.web_server.HTTPServer') as mock_server:
+    """Mock PooledHTTPServer for testing."""
+    with patch('spade_llm.human_interface.web_server.PooledHTTPServer', spec_set=True) as mock_server:
         mock_instance = Mock()
         mock_server.return_value = mock_instance
         yield mock_instance
 
 
+@pytest.fixture
+def patched_server(monkeypatch):
+    """Replace PooledHTTPServer, the filesystem calls and the logger used by run_server."""
+    # The server stops as if the user pressed Ctrl+C
+    mock_server = Mock(spec_set=ws.PooledHTTPServer)
+    mock_server.serve_forever.side_effect = KeyboardInterrupt()
+    
+    mocks = SimpleNamespace(
+        http=Mock(spec_set=ws.PooledHTTPServer, return_value=mock_server),
+        server=mock_server,
+        makedirs=Mock(),
+        chdir=Mock(),
+        logger=Mock()
+    )
+    monkeypatch.setattr(ws, 'PooledHTTPServer', mocks.http)
+    monkeypatch.setattr(ws.os, 'makedirs', mocks.makedirs)
+    monkeypatch.setattr(ws.os, 'chdir', mocks.chdir)
+    monkeypatch.setattr(ws, 'logger', mocks.logger)
+    return mocks
+
+
+@pytest.fixture
+def patched_paths(monkeypatch):
+    """Make run_server resolve its default directory to /app/web_client."""
+    paths = SimpleNamespace(
+        abspath=Mock(return_value='/app/web_server.py'),
+        dirname=Mock(return_value='/app'),
+        join=Mock(return_value='/app/web_client')
+    )
+    for name, mock in vars(paths).items():
+        monkeypatch.setattr(ws.os.path, name, mock)
+    # Resolve again with the patched functions, and forget the fake result after
+    ws._default_directory.cache_clear()
+    yield paths
+    ws._default_directory.cache_clear()
+
+
 @pytest.fixture
 def mock_os_operations():
     """Mock OS operations for testing."""
-    with patch('spade_llm.human_interface.web_server.os.makedirs') as mock_makedirs, \
-         patch('spade_llm.human_interface.web_server.os.chdir') as mock_chdir, \
-         patch('spade_llm.human_interface.web_server.os.path.dirname') as mock_dirname, \
-         patch('spade_llm.human_interface.web_server.os.path.abspath') as mock_abspath, \
-         patch('spade_llm.human_interface.web_server.os.path.join') as mock_join:
+    with patch.multiple('spade_llm.human_interface.web_server.os',
+                        makedirs=DEFAULT, chdir=DEFAULT) as os_mocks, \
+         patch.multiple('spade_llm.human_interface.web_server.os.path',
+                        dirname=DEFAULT, abspath=DEFAULT, join=DEFAULT) as path_mocks:
         
         # Set up default return values
-        mock_abspath.return_value = '/mock/path/to/web_server.py'
-        mock_dirname.return_value = '/mock/path/to'
-        mock_join.return_value = '/mock/path/to/web_client'
+        path_mocks['abspath'].configure_mock(return_value='/mock/path/to/web_server.py')
+        path_mocks['dirname'].configure_mock(return_value='/mock/path/to')
+        path_mocks['join'].configure_mock(return_value='/mock/path/to/web_client')
         
-        yield {
-            'makedirs': mock_makedirs,
-            'chdir': mock_chdir,
-            'dirname': mock_dirname,
-            'abspath': mock_abspath,
-            'join': mock_join
-        }
+        yield {**os_mocks, **path_mocks}
 
 
 @pytest.fixture
@@ -59,10 +92,18 @@ def mock_sys_exit():
         yield mock_exit
 
 
+@pytest.fixture(scope="session")
+def start_server_mod():
+    """The start_server module, imported and smoke-checked once per session."""
+    from spade_llm.human_interface import start_server
+    assert callable(start_server.main)
+    return start_server
+
+
 @pytest.fixture
 def mock_run_server():
     """Mock run_server function for testing."""
-    with patch('spade_llm.human_interface.start_server.run_server') as mock_run:
+    with patch('spade_llm.human_interface.start_server.run_server', autospec=True) as mock_run:
         yield mock_run
 
 
@@ -76,17 +117,13 @@ def temp_directory():
 @pytest.fixture
 def mock_cors_handler():
     """Mock CORS handler for testing."""
-    mock_request = Mock()
-    mock_client_address = ('127.0.0.1', 12345)
-    mock_server = Mock()
+    from spade_llm.human_interface.web_server import CORSRequestHandler
     
-    # Mock the parent class methods
-    with patch('spade_llm.human_interface.web_server.SimpleHTTPRequestHandler.__init__', return_value=None):
-        from spade_llm.human_interface.web_server import CORSRequestHandler
-        handler = CORSRequestHandler(mock_request, mock_client_address, mock_server)
-        handler.send_header = Mock()
-        handler.send_response = Mock()
-        yield handler
+    # Skip the request-handling constructor entirely
+    handler = CORSRequestHandler.__new__(CORSRequestHandler)
+    handler.send_header = Mock()
+    handler.send_response = Mock()
+    yield handler
 
 
 @pytest.fixture
@@ -97,42 +134,35 @@ def mock_argv():
     os.sys.argv = original_argv
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ports():
     """Sample port numbers for testing."""
-    return [8080, 3000, 9090, 8888, 5000]
+    return (8080, 3000, 9090, 8888, 5000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_ports():
     """Invalid port strings for testing."""
-    return ['invalid', 'abc', '8080.5', '', 'port', '8080abc', '8080 ', ' 8080']
+    return ('invalid', 'abc', '8080.5', '', 'port', '8080abc', '8080 ', ' 8080')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_ports():
     """Valid port numbers for testing."""
-    return [80, 443, 8080, 3000, 9090, 65535]
+    return (80, 443, 8080, 3000, 9090, 65535)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def exception_types():
     """Common exception types for testing."""
-    return [
+    return (
         OSError("Address already in use"),
         PermissionError("Permission denied"),
         ConnectionError("Connection failed"),
         RuntimeError("Server runtime error"),
         ValueError("Invalid configuration"),
         Exception("Generic error")
-    ]
-
-
-@pytest.fixture(autouse=True)
-def reset_mocks():
-    """Automatically reset mocks after each test."""
-    yield
-    # Any cleanup code can go here if needed
+    )
 
 
 class MockRequestHandler:
@@ -158,27 +188,22 @@ def mock_request_handler():
     return MockRequestHandler()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server_config():
     """Server configuration for testing."""
-    return {
+    return MappingProxyType({
         'host': 'localhost',
         'default_port': 8080,
         'max_port': 65535,
         'min_port': 1,
         'default_directory': 'web_client'
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cors_headers():
-    """Expected CORS headers for testing."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Cache-Control': 'no-store, no-cache, must-revalidate'
-    }
+    """Expected CORS headers for testing, as (name, value) pairs."""
+    return CORS_HEADER_PAIRS
 
 
 @pytest.fixture
@@ -193,98 +218,98 @@ def mock_server_error():
     return OSError("Server error")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def command_line_scenarios():
     """Command line test scenarios."""
-    return [
-        {
+    return (
+        MappingProxyType({
             'argv': ['start_server.py'],
             'expected_port': 8080,
             'should_error': False
-        },
-        {
+        }),
+        MappingProxyType({
             'argv': ['start_server.py', '9090'],
             'expected_port': 9090,
             'should_error': False
-        },
-        {
+        }),
+        MappingProxyType({
             'argv': ['start_server.py', 'invalid'],
             'expected_port': None,
             'should_error': True
-        },
-        {
+        }),
+        MappingProxyType({
             'argv': ['start_server.py', '65535'],
             'expected_port': 65535,
             'should_error': False
-        },
-        {
+        }),
+        MappingProxyType({
             'argv': ['start_server.py', '0'],
             'expected_port': 0,
             'should_error': False
-        }
-    ]
+        })
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def web_server_test_cases():
     """Web server test cases."""
-    return [
-        {
+    return (
+        MappingProxyType({
             'name': 'default_config',
             'port': 8080,
             'directory': None,
             'expected_host': 'localhost',
             'expected_port': 8080
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'custom_port',
             'port': 9090,
             'directory': None,
             'expected_host': 'localhost',
             'expected_port': 9090
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'custom_directory',
             'port': 8080,
             'directory': '/custom/path',
             'expected_host': 'localhost',
             'expected_port': 8080
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'custom_all',
             'port': 3000,
             'directory': '/test/dir',
             'expected_host': 'localhost',
             'expected_port': 3000
-        }
-    ]
+        })
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_scenarios():
     """Error scenarios for testing."""
-    return [
-        {
+    return (
+        MappingProxyType({
             'name': 'makedirs_error',
             'mock_target': 'makedirs',
             'exception': OSError("Permission denied")
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'chdir_error',
             'mock_target': 'chdir',
             'exception': OSError("Directory not found")
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'server_creation_error',
-            'mock_target': 'HTTPServer',
+            'mock_target': 'PooledHTTPServer',
             'exception': OSError("Address already in use")
-        },
-        {
+        }),
+        MappingProxyType({
             'name': 'permission_error',
             'mock_target': 'makedirs',
             'exception': PermissionError("Permission denied")
-        }
-    ]
+        })
+    )
 
 
 # Helper functions for tests
@@ -296,14 +321,12 @@ def create_mock_server(serve_forever_side_effect=None):
     return mock_server
 
 
-def assert_cors_headers(handler, expected_headers):
+def assert_cors_headers(handler, expected_pairs):
     """Assert that CORS headers are set correctly."""
-    calls = handler.send_header.call_args_list
-    actual_headers = {call[0][0]: call[0][1] for call in calls}
+    actual_pairs = {call[0][:2] for call in handler.send_header.call_args_list}
     
-    for header, expected_value in expected_headers.items():
-        assert header in actual_headers
-        assert actual_headers[header] == expected_value
+    missing = expected_pairs - actual_pairs
+    assert not missing, f"Missing headers: {sorted(missing)}"
 
 
 def assert_print_sequence(mock_print, expected_sequence):
@@ -330,12 +353,13 @@ def create_test_argv(port=None, extra_args=None):
 # Test data
 TEST_PORTS = [80, 443, 8080, 3000, 9090, 65535]
 INVALID_PORTS = ['invalid', 'abc', '8080.5', '', 'port', '8080abc']
-CORS_HEADERS = {
-    'Access-Control-Allow-Origin': '*',
-    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-    'Access-Control-Allow-Headers': 'Content-Type',
-    'Cache-Control': 'no-store, no-cache, must-revalidate'
-}
+CORS_HEADER_PAIRS = frozenset({
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type'),
+    ('Cache-Control', 'no-store, no-cache, must-revalidate'),
+    ('Access-Control-Max-Age', '86400')
+})
 EXPECTED_PRINT_SEQUENCE = [
     "SPADE LLM - Human Expert Web Interface",
     "=" * 40,
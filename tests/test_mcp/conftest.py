@@ -0,0 +1,59 @@
+"""Fixtures for MCP tests."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from spade_llm.mcp.adapters import base as adapters_base
+from spade_llm.mcp.config import SseServerConfig, StdioServerConfig
+
+
+# Adapters only read their server config, so these are shared across a module
+@pytest.fixture(scope="module")
+def basic_stdio_config():
+    """Minimal STDIO server config."""
+    return StdioServerConfig(name="stdio_server", command="python", args=["server.py"])
+
+
+@pytest.fixture(scope="module")
+def complex_stdio_config():
+    """STDIO server config with every option set."""
+    return StdioServerConfig(
+        name="complex_server",
+        command="node",
+        args=["complex_server.js", "--verbose"],
+        env={"NODE_ENV": "development"},
+        cwd="/opt/servers",
+        encoding="utf-8",
+        read_timeout_seconds=30.0,
+        cache_tools=True
+    )
+
+
+@pytest.fixture(scope="module")
+def basic_sse_config():
+    """Minimal SSE server config."""
+    return SseServerConfig(name="sse_server", url="https://api.example.com/sse")
+
+
+@pytest.fixture(scope="module")
+def complex_sse_config():
+    """SSE server config with headers and custom timeouts."""
+    return SseServerConfig(
+        name="complex_sse_server",
+        url="https://api.complex.com/sse/events",
+        headers={
+            "Authorization": "Bearer token123",
+            "Accept": "text/event-stream"
+        },
+        timeout=60.0,
+        sse_read_timeout=900.0,
+        cache_tools=True
+    )
+
+
+@pytest.fixture
+def patched_mcp_session(monkeypatch):
+    """Install a fresh MCPSession mock for the adapters and return it."""
+    session_cls = MagicMock()
+    monkeypatch.setattr(adapters_base, "MCPSession", session_cls)
+    return session_cls
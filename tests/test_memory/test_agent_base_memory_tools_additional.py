@@ -232,6 +232,7 @@ class TestEdgeCasesAndBoundaryConditions:
         assert mock_base_memory.search_memories.call_count == 10
         assert mock_base_memory.get_memories_by_category.call_count == 10
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_memory_backend_timeout_simulation(self, mock_base_memory):
         """Test tools behavior when memory backend times out."""